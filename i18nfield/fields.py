@@ -1,10 +1,14 @@
 import django
-import json
 from django.conf import settings
 from django.db import models
+from django.db.models import F, Value
+from django.db.models.fields.json import KeyTextTransform
+from django.db.models.functions import Cast, Coalesce, NullIf
+from operator import itemgetter
 
 from .forms import I18nFormField, I18nTextarea, I18nTextInput
-from .strings import LazyI18nString
+from .strings import LazyI18nString, json_dumps, similar_locales
+from .utils import languages_dict
 
 
 class I18nFieldMixin:
@@ -16,26 +20,70 @@ class I18nFieldMixin:
             return value
         if value is None:
             return None
+        if isinstance(value, dict):
+            return LazyI18nString._from_dict(value)
         return LazyI18nString(value)
 
     def get_prep_value(self, value):
         if isinstance(value, LazyI18nString):
+            unchanged = value._unchanged_json()
+            if unchanged is not None:
+                return unchanged
             value = value.data
         if isinstance(value, dict):
-            return json.dumps({k: v for k, v in value.items() if v}, sort_keys=True)
+            return json_dumps(dict(filter(itemgetter(1), value.items())))
         if isinstance(value, LazyI18nString.LazyGettextProxy):
-            return json.dumps({lng: value[lng] for lng, lngname in settings.LANGUAGES if value[lng]}, sort_keys=True)
+            # Evaluate every language only once, each lookup runs gettext
+            translations = {}
+            for lng, lngname in settings.LANGUAGES:
+                translated = value[lng]
+                if translated:
+                    translations[lng] = translated
+            return json_dumps(translations)
         return value
 
     def get_prep_lookup(self, lookup_type, value):  # NOQA
         raise TypeError('Lookups on i18n strings are currently not supported.')
 
+    @staticmethod
+    def _from_db(value):
+        if isinstance(value, dict):
+            return LazyI18nString._from_dict(value)
+        return LazyI18nString(value)
+
     if django.VERSION < (2,):
         def from_db_value(self, value, expression, connection, context):
-            return LazyI18nString(value)
+            return self._from_db(value)
     else:
         def from_db_value(self, value, expression, connection):
-            return LazyI18nString(value)
+            return self._from_db(value)
+
+    def localized_expr(self, lng: str):
+        """
+        Returns a query expression that extracts the translation for the locale ``lng`` from
+        this field in the database. Like ``LazyI18nString.localize``, it falls back to the
+        language without its region, to other configured locales of the same language and to
+        ``settings.LANGUAGE_CODE``, skipping empty translations. Use it with ``annotate()`` to
+        read localized text without constructing ``LazyI18nString`` objects::
+
+            title = Book._meta.get_field('title').localized_expr('de')
+            Book.objects.annotate(title_de=title).values('id', 'title_de')
+
+        Rows with an empty value yield ``None``. Any other value needs to be valid JSON, rows
+        with plain, non-JSON text from before the field was internationalized will make the
+        query fail.
+        """
+        # Empty strings are the regular empty value of these fields, but not valid JSON
+        data = Cast(NullIf(F(self.name), Value('')), models.JSONField())
+        locales = [lng]
+        fallbacks = (lng.split('-')[0],) + similar_locales(lng, tuple(languages_dict())) + (settings.LANGUAGE_CODE,)
+        for fallback in fallbacks:
+            if fallback not in locales:
+                locales.append(fallback)
+        lookups = [NullIf(KeyTextTransform(loc, data), Value(''), output_field=models.TextField()) for loc in locales]
+        if len(lookups) == 1:
+            return lookups[0]
+        return Coalesce(*lookups)
 
     def value_to_string(self, obj):
         value = self.value_from_object(obj)
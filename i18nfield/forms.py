@@ -1,8 +1,6 @@
 from typing import List, Union
 
-import copy
 from django import forms
-from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.forms import (
     BaseForm, BaseInlineFormSet, BaseModelForm, BaseModelFormSet,
@@ -12,7 +10,8 @@ from django.forms.models import ModelFormMetaclass
 from django.utils.html import escape
 from django.utils.safestring import mark_safe
 
-from .strings import LazyI18nString
+from .strings import LazyI18nString, json_loads, similar_locales
+from .utils import languages_dict
 
 
 class I18nWidget(forms.MultiWidget):
@@ -28,35 +27,47 @@ class I18nWidget(forms.MultiWidget):
         self.locales = locales
         self.enabled_locales = locales
         self.field = field
+        self._fallbacks = {
+            lng: similar_locales(lng, tuple(self.locales)) for lng in self.locales
+        }
         for lng in self.locales:
-            a = copy.copy(attrs) or {}
-            a['lang'] = lng
-            widgets.append(self.widget(attrs=a))
+            # Widgets copy the attrs they are given, so we can share ours and only set the
+            # language on each widget's own copy.
+            widget = self.widget(attrs=attrs)
+            widget.attrs['lang'] = lng
+            widgets.append(widget)
         super().__init__(widgets, attrs)
 
     def decompress(self, value) -> List[Union[str, None]]:
         data = []
         first_enabled = None
         any_enabled_filled = False
-        if not isinstance(value, LazyI18nString):
-            value = LazyI18nString(value)
+        # Work on the raw translations, we only need a LazyI18nString for the fallback below
+        if isinstance(value, LazyI18nString):
+            translations = value.data
+        elif isinstance(value, str):
+            try:
+                translations = json_loads(value)
+            except ValueError:
+                translations = value
+        else:
+            translations = value
+        is_mapping = isinstance(translations, (dict, LazyI18nString.LazyGettextProxy))
         for i, lng in enumerate(self.locales):
-            dataline = (
-                value.data[lng]
-                if value is not None and (
-                    isinstance(value.data, dict) or isinstance(value.data, LazyI18nString.LazyGettextProxy)
-                ) and lng in value.data
-                else None
-            )
+            dataline = translations[lng] if is_mapping and lng in translations else None
             if lng in self.enabled_locales:
                 if not first_enabled:
                     first_enabled = i
                 if dataline:
                     any_enabled_filled = True
             data.append(dataline)
-        if value and not isinstance(value.data, dict) and not isinstance(value.data, LazyI18nString.LazyGettextProxy):
-            data[first_enabled] = value.data
-        elif value and not any_enabled_filled:
+        if not translations or (isinstance(translations, dict) and not any(translations.values())):
+            return data
+        if not is_mapping:
+            data[first_enabled] = translations
+        elif not any_enabled_filled:
+            if not isinstance(value, LazyI18nString):
+                value = LazyI18nString(translations)
             data[first_enabled] = value.localize(self.enabled_locales[0])
         return data
 
@@ -74,6 +85,7 @@ class I18nWidget(forms.MultiWidget):
         output = []
         final_attrs = self.build_attrs(attrs or dict())
         id_ = final_attrs.get('id', None)
+        languages = languages_dict()
         for i, widget in enumerate(self.widgets):
             if self.locales[i] not in self.enabled_locales:
                 continue
@@ -83,22 +95,14 @@ class I18nWidget(forms.MultiWidget):
                 widget_value = None
 
             if not widget_value and isinstance(original_value, LazyI18nString) and isinstance(original_value.data, dict):
-                locale = self.locales[i]
-                firstpart = locale.split('-')[0]
-
-                if not widget_value:
-                    similar = [
-                        loc for loc in self.locales
-                        if (loc.startswith(firstpart + "-") or firstpart == loc) and loc != locale
-                    ]
-                    for s in similar:
-                        if original_value.data.get(s) and s not in self.enabled_locales:
-                            widget_value = original_value.data.get(s)
-                            break
+                for s in self._fallbacks[self.locales[i]]:
+                    if original_value.data.get(s) and s not in self.enabled_locales:
+                        widget_value = original_value.data.get(s)
+                        break
 
             final_attrs_widget = final_attrs.copy()
             if id_:
-                human_locale_name = dict(settings.LANGUAGES).get(self.locales[i], self.locales[i])
+                human_locale_name = languages.get(self.locales[i], self.locales[i])
                 final_attrs_widget['id'] = '%s_%s' % (id_, i)
                 final_attrs_widget['title'] = human_locale_name
                 # still allow forms to override the placeholder
@@ -161,25 +165,32 @@ class I18nFormField(forms.MultiValueField):
         found = False
         found_all = True
         clean_data = []
-        errors = []
+        errors = {}
         for i, field in enumerate(self.fields):
             try:
                 field_value = value[i]
             except (IndexError, TypeError):
                 field_value = None
-            if field_value not in self.empty_values:
+            if not self._is_empty(field_value):
                 found = True
-            elif field.locale in self.widget.enabled_locales:
-                found_all = False
+            else:
+                if field.locale in self.widget.enabled_locales:
+                    found_all = False
+                if not field.required:
+                    # CharField.clean() would not run any validators on an empty value
+                    clean_data.append(field.empty_value)
+                    continue
             try:
                 clean_data.append(field.clean(field_value))
             except forms.ValidationError as e:
                 # Collect all validation errors in a single list, which we'll
                 # raise at the end of clean(), rather than raising a single
-                # exception for the first error we encounter. Skip duplicates.
-                errors.extend(m for m in e.error_list if m not in errors)
+                # exception for the first error we encounter. Skip duplicates, which
+                # are keyed by code and message to avoid a linear scan per error.
+                for m in e.error_list:
+                    errors.setdefault((m.code, str(m)), m)
         if errors:
-            raise forms.ValidationError(errors)
+            raise forms.ValidationError(list(errors.values()))
         if self.one_required and not found:
             raise forms.ValidationError(self.error_messages['required'], code='required')
         if self.require_all_fields and not found_all:
@@ -193,10 +204,11 @@ class I18nFormField(forms.MultiValueField):
     def __init__(self, *args, **kwargs):
         fields = []
         defaults = {
-            'widget': self.widget,
             'max_length': kwargs.pop('max_length', None),
         }
-        self.locales = kwargs.pop('locales', [loc[0] for loc in settings.LANGUAGES])
+        self.locales = kwargs.pop('locales', None)
+        if self.locales is None:
+            self.locales = list(languages_dict())
         self.one_required = kwargs.get('required', True)
         require_all_fields = kwargs.pop('require_all_fields', False)
         kwargs['required'] = False
@@ -204,6 +216,10 @@ class I18nFormField(forms.MultiValueField):
             locales=self.locales, field=self, **kwargs.pop('widget_kwargs', {})
         )
         defaults.update(**kwargs)
+        # The sub-fields are never rendered on their own. Handing them the I18nWidget would
+        # make every one of them carry (and deep-copy, once per form instance) a copy of
+        # the widgets for all locales.
+        defaults['widget'] = forms.CharField.widget
         for lngcode in self.locales:
             defaults['label'] = '%s (%s)' % (defaults.get('label'), lngcode)
             field = forms.CharField(**defaults)
@@ -213,6 +229,13 @@ class I18nFormField(forms.MultiValueField):
             fields=fields, require_all_fields=False, *args, **kwargs
         )
         self.require_all_fields = require_all_fields
+        self._empty_scalars = frozenset(v for v in self.empty_values if v is None or isinstance(v, str))
+
+    def _is_empty(self, value) -> bool:
+        if value is None or isinstance(value, str):
+            # Hashable, so we can use a set lookup instead of scanning empty_values
+            return value in self._empty_scalars
+        return value in self.empty_values
 
     def has_changed(self, initial, data):
         if self.disabled:
@@ -2,6 +2,7 @@ from django.conf import settings
 
 from .fields import I18nCharField, I18nTextField
 from .strings import LazyI18nString
+from .utils import languages_dict
 
 try:
     from rest_framework.exceptions import ValidationError
@@ -56,7 +57,8 @@ class I18nField(Field):
         elif isinstance(data, dict):
             if any([not isinstance(v, str) for v in data.values()]):
                 raise ValidationError('All entries must be strings.')
-            if any([k not in dict(settings.LANGUAGES) for k in data.keys()]):
+            languages = languages_dict()
+            if any([k not in languages for k in data.keys()]):
                 raise ValidationError('Invalid languages included.')
             return LazyI18nString(data)
         else:
@@ -1,15 +1,57 @@
-from typing import Dict, Optional, Union
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 import json
 from django.conf import settings
 from django.utils import translation
 from django.utils.translation import gettext, override
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(s: str):
+    """
+    Parse a JSON document, using ``orjson`` if it is installed. This is used throughout
+    i18nfield to read stored values.
+    """
+    if orjson is not None:
+        return orjson.loads(s)
+    return json.loads(s)
+
+
+def json_dumps(d, sort_keys: bool = True) -> str:
+    """
+    Serialize ``d`` to a compact, UTF-8 JSON string, using ``orjson`` if it is installed. This
+    is used throughout i18nfield to store values and both code paths produce identical output. Non-ASCII characters are not escaped, so MySQL tables
+    need the ``utf8mb4`` character set to store e.g. emoji.
+    """
+    if orjson is not None:
+        return orjson.dumps(d, option=orjson.OPT_SORT_KEYS if sort_keys else 0).decode()
+    return json.dumps(d, sort_keys=sort_keys, ensure_ascii=False, separators=(',', ':'))
+
+
+@lru_cache(maxsize=1024)
+def similar_locales(lng: str, locales: Tuple[str, ...]) -> Tuple[str, ...]:
+    """
+    Returns all locales out of ``locales`` that share their language with ``lng``, e.g.
+    ``de`` and ``de-AT`` for ``de-informal``, but not ``lng`` itself. This is used throughout
+    i18nfield to find fallback translations and the result is memoized.
+    """
+    firstpart = lng.split('-')[0]
+    return tuple(
+        loc for loc in locales
+        if (loc.startswith(firstpart + "-") or firstpart == loc) and loc != lng
+    )
 
 
 class LazyI18nString:
     """
     This represents an internationalized string that is/was/will be stored in the database.
     """
+    __slots__ = ('data', '_original_json', '_original_data', '__weakref__')
 
     def __init__(self, data: Optional[Union[str, Dict[str, str]]]):
         """
@@ -20,14 +62,28 @@ class LazyI18nString:
             If this is anything else, it will be cast to a string and used for all languages.
         """
         self.data = data
+        self._original_json = None
+        self._original_data = None
         if isinstance(self.data, str) and self.data is not None:
             try:
-                j = json.loads(self.data)
+                j = json_loads(self.data)
             except ValueError:
                 pass
             else:
+                if isinstance(j, dict):
+                    self._remember_json(self.data, j)
                 self.data = j
 
+    def __getstate__(self):
+        # Objects with __slots__ can not be pickled with protocols 0 and 1 otherwise
+        return {'data': self.data, '_original_json': self._original_json, '_original_data': self._original_data}
+
+    def __setstate__(self, state):
+        self.data = state['data']
+        # Pickles created by earlier versions only contain data
+        self._original_json = state.get('_original_json')
+        self._original_data = state.get('_original_data')
+
     def __str__(self) -> str:
         """
         Evaluate the given string with respect to the currently active locale.
@@ -61,27 +117,25 @@ class LazyI18nString:
             return ""
 
         if isinstance(self.data, dict):
+            data = self.data
+            value = data.get(lng)
+            if value:
+                return value
             firstpart = lng.split('-')[0]
-            similar = [
-                loc for loc in self.data.keys()
-                if (loc.startswith(firstpart + "-") or firstpart == loc) and loc != lng
-            ]
-            if self.data.get(lng):
-                return self.data[lng]
-            elif self.data.get(firstpart):
-                return self.data[firstpart]
-            elif similar and any([self.data.get(s) for s in similar]):
-                for s in similar:
-                    if self.data.get(s):
-                        return self.data.get(s)
-            elif self.data.get(settings.LANGUAGE_CODE):
-                return self.data[settings.LANGUAGE_CODE]
-            else:
-                filled = [f for f in self.data.values() if f]
-                if filled:
-                    return filled[0]
-                else:
-                    return ""
+            value = data.get(firstpart)
+            if value:
+                return value
+            for s in similar_locales(lng, tuple(data)):
+                value = data.get(s)
+                if value:
+                    return value
+            value = data.get(settings.LANGUAGE_CODE)
+            if value:
+                return value
+            for value in data.values():
+                if value:
+                    return value
+            return ""
         else:
             with override(lng):
                 return str(self.data)
@@ -91,6 +145,28 @@ class LazyI18nString:
         Apply a transformation function f to all translations.
         """
         self.data = {k: f(v) for k, v in self.data.items()}
+        self._original_json = None
+        self._original_data = None
+
+    def _remember_json(self, value: str, data: Dict[str, str]):
+        """
+        Remembers the JSON document ``value`` that ``data`` has been decoded from, so that
+        ``_unchanged_json`` can return it. Documents with empty translations are not
+        remembered, so they get cleaned up on the next save.
+        """
+        if all(data.values()):
+            self._original_json = value
+            self._original_data = dict(data)
+
+    def _unchanged_json(self) -> Optional[str]:
+        """
+        Returns the JSON document this string has been parsed from, as long as the
+        translations have not been modified since and none of them was empty. Returns
+        ``None`` otherwise. The key order and whitespace of the stored document are kept.
+        """
+        if self._original_json is not None and self.data == self._original_data:
+            return self._original_json
+        return None
 
     def __repr__(self) -> str:  # NOQA
         return '<LazyI18nString: %s>' % repr(self.data)
@@ -109,12 +185,29 @@ class LazyI18nString:
         return self.data == other
 
     class LazyGettextProxy:
+        __slots__ = ('lazygettext', '_cache')
+
         def __init__(self, lazygettext):
             self.lazygettext = lazygettext
+            self._cache = {}
+
+        def __getstate__(self):
+            # The translations are not pickled, they may differ wherever this is unpickled
+            return {'lazygettext': self.lazygettext}
+
+        def __setstate__(self, state):
+            self.lazygettext = state['lazygettext']
+            self._cache = {}
 
         def __getitem__(self, item):
-            with override(item):
-                return str(gettext(self.lazygettext))
+            # Activating a language is expensive and the source string never changes, so we
+            # remember the translation for every language we have been asked for.
+            try:
+                return self._cache[item]
+            except KeyError:
+                with override(item):
+                    result = self._cache[item] = str(gettext(self.lazygettext))
+                return result
 
         def __contains__(self, item):
             return True
@@ -125,6 +218,44 @@ class LazyI18nString:
         def __repr__(self):  # NOQA
             return '<LazyGettextProxy: %s>' % repr(self.lazygettext)
 
+    @classmethod
+    def _from_dict(cls, data: Dict[str, str]) -> 'LazyI18nString':
+        """
+        Creates a new i18n-aware string from an already decoded dictionary, skipping the
+        type checks in ``__init__``.
+        """
+        result = cls.__new__(cls)
+        result.data = data
+        result._original_json = None
+        result._original_data = None
+        return result
+
+    @classmethod
+    def bulk_from_json(cls, values: Iterable[Optional[str]]) -> List['LazyI18nString']:
+        """
+        Creates i18n-aware strings for many stored values at once. This gives the same result as
+        calling the constructor on every value, but is faster on large result sets, e.g. if you
+        fetch raw column values yourself.
+
+        :param values: An iterable of values as they are stored in the database.
+        """
+        from_dict = cls._from_dict
+        result = []
+        for value in values:
+            if isinstance(value, str):
+                try:
+                    data = json_loads(value)
+                except ValueError:
+                    pass
+                else:
+                    if isinstance(data, dict):
+                        s = from_dict(data)
+                        s._remember_json(value, data)
+                        result.append(s)
+                        continue
+            result.append(cls(value))
+        return result
+
     @classmethod
     def from_gettext(cls, lazygettext) -> 'LazyI18nString':
         result = LazyI18nString({})
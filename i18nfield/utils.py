@@ -1,9 +1,31 @@
+from typing import Dict
+
+from django.conf import settings
 from django.core.serializers.json import DjangoJSONEncoder
+from django.core.signals import setting_changed
 from django.db.models import Model, QuerySet
+from django.dispatch import receiver
+from functools import lru_cache
 
 from .strings import LazyI18nString
 
 
+@lru_cache(maxsize=1)
+def languages_dict() -> Dict[str, str]:
+    """
+    Returns ``settings.LANGUAGES`` as a dictionary mapping language codes to their names.
+    This is built only once per process and reset if the setting is changed, e.g. by
+    ``override_settings`` in tests. Do not modify the returned dictionary.
+    """
+    return dict(settings.LANGUAGES)
+
+
+@receiver(setting_changed)
+def _reset_languages_dict(setting, **kwargs):
+    if setting == 'LANGUAGES':
+        languages_dict.cache_clear()
+
+
 class I18nJSONEncoder(DjangoJSONEncoder):
     def default(self, obj):
         if isinstance(obj, LazyI18nString):
@@ -38,6 +38,9 @@ setup(
     keywords='i18n strings database models',
     install_requires=[
     ],
+    extras_require={
+        'orjson': ['orjson'],
+    },
 
     packages=find_packages(exclude=['tests', 'tests.*', 'demoproject', 'demoproject.*']),
     include_package_data=True,
@@ -1,5 +1,7 @@
 import pytest
 from django.core import serializers
+from django.test import override_settings
+from django.utils.translation import gettext_noop
 
 from i18nfield.fields import I18nFieldMixin
 from i18nfield.strings import LazyI18nString
@@ -38,6 +40,8 @@ def test_to_python():
     mx.to_python('A') == LazyI18nString('A')
     mx.to_python(LazyI18nString('A')) == LazyI18nString('A')
     mx.to_python(None) is None
+    assert mx.to_python({'en': 'A'}) == LazyI18nString({'en': 'A'})
+    assert mx.from_db_value({'en': 'A'}, None, None) == LazyI18nString({'en': 'A'})
 
 
 @pytest.mark.django_db
@@ -114,3 +118,72 @@ def test_initializing_with_string_only():
         assert book.object.abstract.data == "Frodo will einen Ring zerstören"
 
         break
+
+
+def test_prep_value_independent_of_orjson(monkeypatch):
+    from i18nfield import strings
+
+    mx = I18nFieldMixin()
+    value = LazyI18nString({'en': 'The Lord of the Rings', 'de': 'Der Herr der Ringe – Die Gefährten', 'fr': ''})
+    expected = '{"de":"Der Herr der Ringe – Die Gefährten","en":"The Lord of the Rings"}'
+    assert mx.get_prep_value(value) == expected
+    monkeypatch.setattr(strings, 'orjson', None)
+    assert mx.get_prep_value(value) == expected
+    assert LazyI18nString(expected).data == {'de': 'Der Herr der Ringe – Die Gefährten', 'en': 'The Lord of the Rings'}
+
+
+def test_prep_value_from_gettext():
+    mx = I18nFieldMixin()
+    value = LazyI18nString.from_gettext(gettext_noop('Welcome'))
+    assert LazyI18nString(mx.get_prep_value(value)).data == {'de': 'Welcome', 'en': 'Welcome', 'fr': 'Welcome'}
+
+
+def test_prep_value_reuses_unchanged_json():
+    mx = I18nFieldMixin()
+    stored = '{"de": "Hallo", "en": "Hello"}'
+    value = LazyI18nString(stored)
+    assert mx.get_prep_value(value) is stored
+    value.data['en'] = 'Hi'
+    assert mx.get_prep_value(value) == '{"de":"Hallo","en":"Hi"}'
+    value = LazyI18nString(stored)
+    value.map(lambda s: s.upper())
+    assert mx.get_prep_value(value) == '{"de":"HALLO","en":"HELLO"}'
+
+
+@pytest.mark.django_db
+def test_localized_expr():
+    a = Author.objects.create(name='Tolkien')
+    Book.objects.create(author=a, title=LazyI18nString({'de': 'Der Herr der Ringe', 'en': 'The Lord of the Rings'}), abstract='')
+    Book.objects.create(author=a, title=LazyI18nString({'en': 'The Hobbit'}), abstract='')
+    Book.objects.create(author=a, title=LazyI18nString({'fr': 'Le Silmarillion'}), abstract='')
+    title = Book._meta.get_field('title')
+    assert list(Book.objects.annotate(t=title.localized_expr('de-AT')).order_by('pk').values_list('t', flat=True)) == [
+        'Der Herr der Ringe', 'The Hobbit', None
+    ]
+    assert list(Book.objects.annotate(t=title.localized_expr('en')).order_by('pk').values_list('t', flat=True)) == [
+        'The Lord of the Rings', 'The Hobbit', None
+    ]
+    abstract = Book._meta.get_field('abstract')
+    assert list(Book.objects.annotate(t=abstract.localized_expr('en')).order_by('pk').values_list('t', flat=True)) == [
+        None, None, None
+    ]
+
+
+@pytest.mark.django_db
+def test_localized_expr_matches_localize():
+    a = Author.objects.create(name='Tolkien')
+    Book.objects.create(author=a, title=LazyI18nString({'de-AT': 'Servus', 'en': 'Hello'}), abstract='')
+    b2 = Book.objects.create(author=a, title='', abstract='')
+    # Bypass get_prep_value, which would strip the empty translation
+    Book.objects.filter(pk=b2.pk).update(title='{"de": "", "en": "Hello"}')
+    title = Book._meta.get_field('title')
+    with override_settings(LANGUAGES=[('de', 'German'), ('de-AT', 'Austrian German'), ('en', 'English')]):
+        qs = Book.objects.annotate(t=title.localized_expr('de')).order_by('pk')
+        assert list(qs.values_list('t', flat=True)) == ['Servus', 'Hello']
+        assert [b.title.localize('de') for b in qs] == ['Servus', 'Hello']
+
+
+def test_prep_value_cleans_up_empty_translations():
+    mx = I18nFieldMixin()
+    assert mx.get_prep_value(LazyI18nString('{"en": "Hello", "de": ""}')) == '{"en":"Hello"}'
+    assert mx.get_prep_value(LazyI18nString.bulk_from_json(['{"en": "Hello", "de": ""}'])[0]) == '{"en":"Hello"}'
@@ -1,11 +1,12 @@
 import pytest
 from django.core.exceptions import ValidationError
 from django.forms import inlineformset_factory, modelformset_factory
+from django.test import override_settings
 from lxml.html import html5parser
 
 from i18nfield.forms import (
     I18nForm, I18nFormField, I18nInlineFormSet, I18nModelFormSet,
-    I18nTextInput,
+    I18nTextarea, I18nTextInput,
 )
 from i18nfield.strings import LazyI18nString
 
@@ -22,6 +23,21 @@ def test_field_defaults():
     })
 
 
+def test_field_defaults_follow_languages_setting():
+    assert len(I18nFormField(widget=I18nTextInput).fields) == 3
+    with override_settings(LANGUAGES=[('de', 'German'), ('en', 'English')]):
+        f = I18nFormField(widget=I18nTextInput)
+        assert f.locales == ['de', 'en']
+        assert 'title="English"' in f.widget.render('foo', LazyI18nString({'en': 'B'}), attrs={'id': 'foo'})
+    assert len(I18nFormField(widget=I18nTextInput).fields) == 3
+
+
+def test_subfields_do_not_copy_i18n_widget():
+    f = I18nFormField(widget=I18nTextInput)
+    assert isinstance(f.widget, I18nTextInput)
+    assert not any(isinstance(sub.widget, I18nTextInput) for sub in f.fields)
+
+
 def test_limited_locales():
     f = I18nFormField(widget=I18nTextInput, locales=['de', 'fr'])
     assert len(f.fields) == 2
@@ -37,11 +53,14 @@ def test_required():
     assert f.clean(['', 'B'])
     with pytest.raises(ValidationError):
         assert f.clean(['', ''])
+    with pytest.raises(ValidationError):
+        assert f.clean([None, [], ()])
 
 
 def test_not_required():
     f = I18nFormField(widget=I18nTextInput, required=False)
     f.clean(['', ''])
+    assert f.clean(['A', None]).data == {'de': 'A', 'en': '', 'fr': ''}
 
 
 def test_require_all_fields():
@@ -87,6 +106,9 @@ def test_max_length():
     assert f.clean(['123', ''])
     with pytest.raises(ValidationError):
         f.clean(['1234567890123456789012', ''])
+    with pytest.raises(ValidationError) as excinfo:
+        f.clean(['1234567890123456789012', '1234567890123456789012', '12345678901234567890123'])
+    assert len(excinfo.value.error_list) == 2
 
 
 def test_modelform_pass_locales_down():
@@ -140,6 +162,14 @@ def test_widget():
     }
 
 
+def test_widget_attrs_per_locale():
+    attrs = {'class': 'foo'}
+    f = I18nFormField(widget=I18nTextarea, widget_kwargs={'attrs': attrs})
+    assert attrs == {'class': 'foo'}
+    assert [w.attrs['lang'] for w in f.widget.widgets] == ['de', 'en', 'fr']
+    assert all(w.attrs['class'] == 'foo' and w.attrs['rows'] for w in f.widget.widgets)
+
+
 def test_widget_empty():
     f = I18nFormField(widget=I18nTextInput, required=False, localize=True)
     rendered = f.widget.render('foo', [])
@@ -189,6 +219,15 @@ def test_widget_decompress_naive():
     ]
 
 
+def test_widget_decompress_json_and_empty():
+    f = I18nFormField(widget=I18nTextInput, required=False)
+    assert f.widget.decompress('{"de": "Hallo", "en": "Hello"}') == [
+        'Hallo', 'Hello', None
+    ]
+    assert f.widget.decompress(None) == [None, None, None]
+    assert f.widget.decompress({'de': '', 'en': ''}) == ['', '', None]
+
+
 def test_widget_decompress_missing():
     f = I18nFormField(widget=I18nTextInput, required=False)
     assert f.widget.decompress({'de': 'Hallo', 'en': 'Hello'}) == [
@@ -1,3 +1,5 @@
+import copy
+import pickle
 from django.utils import translation
 from django.utils.translation import gettext_noop
 
@@ -79,6 +81,16 @@ def test_missing_translation():
     assert str(s) == 'Hello'
 
 
+def test_fallback_order():
+    s = LazyI18nString({'fr': 'Bonjour', 'en': 'Hello', 'de-informal': '', 'de-AT': 'Servus'})
+    assert s.localize('de') == 'Servus'
+    assert s.localize('de-informal') == 'Servus'
+    assert s.localize('it') == 'Hello'
+    s = LazyI18nString({'fr': 'Bonjour', 'en': ''})
+    assert s.localize('it') == 'Bonjour'
+    assert LazyI18nString({'en': ''}).localize('en') == ''
+
+
 def test_legacy_string():
     s = LazyI18nString("Hello")
     translation.activate('en')
@@ -131,6 +143,24 @@ def test_from_gettext():
     assert lstr.data['en'] == 'Welcome'
 
 
+def test_from_gettext_translates_once(monkeypatch):
+    from i18nfield import strings
+
+    calls = []
+    override = strings.override
+
+    def counting_override(lng):
+        calls.append(lng)
+        return override(lng)
+
+    monkeypatch.setattr(strings, 'override', counting_override)
+    lstr = LazyI18nString.from_gettext(gettext_noop('Welcome'))
+    assert lstr.data['en'] == 'Welcome'
+    assert lstr.data['en'] == 'Welcome'
+    assert lstr.data['de'] == 'Welcome'
+    assert calls == ['en', 'de']
+
+
 def test_map():
     data = {
         'de': 'hallo',
@@ -146,3 +176,34 @@ def test_map():
     assert str(s) == 'Hello'
     translation.activate('de')
     assert str(s) == 'Hallo'
+
+
+def test_copy_and_pickle():
+    s = LazyI18nString({'de': 'Hallo', 'en': 'Hello'})
+    assert copy.deepcopy(s) == s
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        assert pickle.loads(pickle.dumps(s, protocol=protocol)) == s
+        assert pickle.loads(pickle.dumps(LazyI18nString('Hello'), protocol=protocol)).data == 'Hello'
+        stored = pickle.loads(pickle.dumps(LazyI18nString('{"en": "Hello"}'), protocol=protocol))
+        assert stored._unchanged_json() == '{"en": "Hello"}'
+        proxied = pickle.loads(pickle.dumps(LazyI18nString.from_gettext(gettext_noop('Welcome')), protocol=protocol))
+        assert proxied.data['en'] == 'Welcome'
+
+
+def test_str_follows_data_changes():
+    s = LazyI18nString({'de': 'Hallo', 'en': 'Hello'})
+    translation.activate('de')
+    assert str(s) == 'Hallo'
+    translation.activate('en')
+    assert str(s) == 'Hello'
+    s.data['en'] = 'Hi'
+    assert str(s) == 'Hi'
+    s.data = {'en': 'Hey'}
+    assert str(s) == 'Hey'
+    translation.activate('de')
+    assert str(s) == 'Hey'
+
+
+def test_bulk_from_json():
+    values = ['{"en": "Hello"}', 'Invalid JSON', None, '"Hello"']
+    assert [s.data for s in LazyI18nString.bulk_from_json(values)] == [s.data for s in map(LazyI18nString, values)]
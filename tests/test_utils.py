@@ -1,9 +1,10 @@
 import json
 import pytest
 from decimal import Decimal
+from django.test import override_settings
 
 from i18nfield.strings import LazyI18nString
-from i18nfield.utils import I18nJSONEncoder
+from i18nfield.utils import I18nJSONEncoder, languages_dict
 
 from .testapp.models import Book
 
@@ -29,3 +30,10 @@ def test_encode_json():
         "books": [],
         'num': '0.00'
     }
+
+
+def test_languages_dict():
+    assert list(languages_dict()) == ['de', 'en', 'fr']
+    with override_settings(LANGUAGES=[('de', 'German')]):
+        assert languages_dict() == {'de': 'German'}
+    assert list(languages_dict()) == ['de', 'en', 'fr']